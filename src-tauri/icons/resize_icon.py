@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 from PIL import Image
 
-# Open the original icon
-img = Image.open('icon_original.png')
+# Open the original icon (RGBA so the paste below is a direct copy)
+img = Image.open('icon_original.png').convert('RGBA')
 
 # Calculate 90% size (leaving 5% padding on each side)
 new_size = int(512 * 0.90)  # 461 pixels
@@ -16,8 +16,10 @@ new_img = Image.new('RGBA', (512, 512), (0, 0, 0, 0))
 # Calculate position to center the resized icon
 position = ((512 - new_size) // 2, (512 - new_size) // 2)
 
-# Paste the resized icon onto the center
-new_img.paste(img_resized, position, img_resized)
+# Paste the resized icon onto the center. No mask argument: the source is
+# already RGBA, so this copies pixels (alpha included) instead of running a
+# per-pixel alpha blend over the whole canvas.
+new_img.paste(img_resized, position)
 
 # Save the new icon
 new_img.save('icon.png', 'PNG')
@@ -330,17 +330,33 @@ pub async fn install_terraform() -> Result<String, String> {
         .await
         .map_err(|e| format!("Failed to read response: {}", e))?;
 
+    // Unzipping is blocking filesystem work; run it off the async runtime so
+    // status polls and other commands aren't serialized behind it.
+    let extract_dir = install_dir.clone();
+    tokio::task::spawn_blocking(move || extract_terraform_zip(&extract_dir, &bytes))
+        .await
+        .map_err(|e| e.to_string())??;
+
+    Ok(format!(
+        "Terraform installed to {}",
+        install_dir.display()
+    ))
+}
+
+/// Write the downloaded archive to a temp file and extract it into the
+/// install directory, marking binaries executable on unix.
+fn extract_terraform_zip(install_dir: &std::path::Path, bytes: &[u8]) -> Result<(), String> {
     let temp_dir = tempfile::tempdir().map_err(|e| e.to_string())?;
     let zip_path = temp_dir.path().join("terraform.zip");
 
-    fs::write(&zip_path, &bytes).map_err(|e| format!("Failed to write zip: {}", e))?;
+    fs::write(&zip_path, bytes).map_err(|e| format!("Failed to write zip: {}", e))?;
 
     let file = fs::File::open(&zip_path).map_err(|e| e.to_string())?;
     let mut archive = zip::ZipArchive::new(file).map_err(|e| e.to_string())?;
 
     for i in 0..archive.len() {
         let mut file = archive.by_index(i).map_err(|e| e.to_string())?;
-        let outpath = safe_zip_entry_path(&install_dir, file.name())?;
+        let outpath = safe_zip_entry_path(install_dir, file.name())?;
 
         if file.name().ends_with('/') {
             fs::create_dir_all(&outpath).map_err(|e| e.to_string())?;
@@ -361,15 +377,15 @@ pub async fn install_terraform() -> Result<String, String> {
         }
     }
 
-    Ok(format!(
-        "Terraform installed to {}",
-        install_dir.display()
-    ))
+    Ok(())
 }
 
 /// Save deployment configuration (copy template + generate `terraform.tfvars`).
+///
+/// The template-tree copy is filesystem-heavy, so the work runs on a blocking
+/// thread rather than serializing other commands (e.g. status polls) behind it.
 #[tauri::command]
-pub fn save_configuration(
+pub async fn save_configuration(
     app: AppHandle,
     template_id: String,
     deployment_name: String,
@@ -381,25 +397,41 @@ pub fn save_configuration(
 
     let templates_dir = get_templates_dir(&app)?;
     let template_dir = templates_dir.join(&safe_template_id);
+
+    let deployments_dir = get_deployments_dir(&app)?;
+    let deployment_dir = deployments_dir.join(&safe_deployment_name);
+
+    tokio::task::spawn_blocking(move || {
+        write_configuration(&template_dir, &deployment_dir, values, credentials)
+    })
+    .await
+    .map_err(|e| e.to_string())?
+}
+
+/// Blocking body of `save_configuration`: copy the template tree (first save
+/// only) and write `terraform.tfvars` from the merged values.
+fn write_configuration(
+    template_dir: &std::path::Path,
+    deployment_dir: &std::path::Path,
+    values: HashMap<String, serde_json::Value>,
+    credentials: Option<CloudCredentials>,
+) -> Result<String, String> {
     let template_variables_path = template_dir.join("variables.tf");
 
     if !template_variables_path.exists() {
         return Err("Template not found".to_string());
     }
 
-    let deployments_dir = get_deployments_dir(&app)?;
-    let deployment_dir = deployments_dir.join(&safe_deployment_name);
-
     if !deployment_dir.exists() {
-        fs::create_dir_all(&deployment_dir).map_err(|e| e.to_string())?;
-        copy_dir_all(&template_dir, &deployment_dir)?;
+        fs::create_dir_all(deployment_dir).map_err(|e| e.to_string())?;
+        copy_dir_all(template_dir, deployment_dir)?;
     }
 
     let tfvars_path = deployment_dir.join("terraform.tfvars");
     let variables_path = deployment_dir.join("variables.tf");
 
     // Merge credentials into values for terraform variables that need them
-    let mut merged_values = values.clone();
+    let mut merged_values = values;
     if let Some(creds) = credentials {
         if let Some(ref account_id) = creds.databricks_account_id {
             if !account_id.is_empty() {
@@ -544,7 +576,12 @@ pub fn save_configuration(
     let variables = terraform::parse_variables_tf(&variables_content);
 
     let tfvars_content = terraform::generate_tfvars(&merged_values, &variables);
-    fs::write(&tfvars_path, tfvars_content).map_err(|e| e.to_string())?;
+    // Write to a sibling temp file and rename so a crash mid-write can't
+    // leave a truncated terraform.tfvars behind (the rename is atomic on
+    // the same filesystem).
+    let tfvars_tmp = deployment_dir.join("terraform.tfvars.tmp");
+    fs::write(&tfvars_tmp, tfvars_content).map_err(|e| e.to_string())?;
+    fs::rename(&tfvars_tmp, &tfvars_path).map_err(|e| e.to_string())?;
 
     Ok(deployment_dir.to_string_lossy().to_string())
 }
@@ -559,28 +596,15 @@ pub async fn run_terraform_command(
 ) -> Result<(), String> {
     let safe_deployment_name = sanitize_deployment_name(&deployment_name)?;
 
-    // Check if a Terraform deployment is already in progress
+    // Check if a Terraform deployment is already in progress. The running
+    // flag is owned by this process (set before spawn, cleared when the
+    // command finishes), so checking it replaces the previous `kill -0`
+    // probe of the recorded PID — which forked a process on every dispatch
+    // and was only as reliable as the same flag on Windows anyway.
     {
-        let proc = CURRENT_PROCESS.lock().map_err(|e| e.to_string())?;
-        if let Some(pid) = *proc {
-            #[cfg(unix)]
-            {
-                let output = super::silent_cmd("kill")
-                    .args(["-0", &pid.to_string()])
-                    .output();
-                if let Ok(out) = output {
-                    if out.status.success() {
-                        return Err("A deployment is already running".to_string());
-                    }
-                }
-            }
-            #[cfg(windows)]
-            {
-                let status = DEPLOYMENT_STATUS.lock().map_err(|e| e.to_string())?;
-                if status.running {
-                    return Err("A deployment is already running".to_string());
-                }
-            }
+        let status = DEPLOYMENT_STATUS.lock().map_err(|e| e.to_string())?;
+        if status.running {
+            return Err("A deployment is already running".to_string());
         }
     }
 
@@ -690,6 +714,17 @@ pub fn get_deployment_status() -> Result<DeploymentStatus, String> {
     Ok(status.clone())
 }
 
+/// Get deployment status with only the output appended since `cursor`.
+///
+/// The frontend polls this instead of `get_deployment_status` during long
+/// commands so each poll transfers just the new output bytes rather than the
+/// whole accumulated log.
+#[tauri::command]
+pub fn get_deployment_status_delta(cursor: usize) -> Result<terraform::DeploymentStatusDelta, String> {
+    let status = DEPLOYMENT_STATUS.lock().map_err(|e| e.to_string())?;
+    Ok(terraform::status_delta(&status, cursor))
+}
+
 /// Reset deployment status to default.
 #[tauri::command]
 pub fn reset_deployment_status() -> Result<(), String> {
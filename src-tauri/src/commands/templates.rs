@@ -5,12 +5,49 @@ use super::{
     TEMPLATES_VERSION,
 };
 use crate::terraform;
+use std::collections::HashMap;
 use std::fs;
+use std::path::{Path, PathBuf};
+use std::sync::Mutex;
+use std::time::SystemTime;
 use tauri::{AppHandle, Manager};
 
 const GITHUB_TEMPLATES_BASE: &str =
     "https://github.com/OgnjenPantelic/workspace-creator/tree/main/src-tauri/templates";
 
+lazy_static::lazy_static! {
+    /// Parsed variables.tf files keyed by path, invalidated on (mtime, size)
+    /// change. Template files only change on version updates, so in practice
+    /// each template is parsed once per app run instead of once per visit to
+    /// the configuration screen.
+    static ref VARIABLES_CACHE: Mutex<HashMap<PathBuf, ((SystemTime, u64), Vec<terraform::TerraformVariable>)>> =
+        Mutex::new(HashMap::new());
+}
+
+/// Read and parse a `variables.tf`, reusing the cached parse while the file
+/// is unchanged on disk.
+fn parse_variables_file_cached(path: &Path) -> Result<Vec<terraform::TerraformVariable>, String> {
+    let meta = fs::metadata(path).map_err(|e| e.to_string())?;
+    let key = (meta.modified().map_err(|e| e.to_string())?, meta.len());
+
+    if let Ok(cache) = VARIABLES_CACHE.lock() {
+        if let Some((cached_key, vars)) = cache.get(path) {
+            if *cached_key == key {
+                return Ok(vars.clone());
+            }
+        }
+    }
+
+    let content = fs::read_to_string(path).map_err(|e| e.to_string())?;
+    let vars = terraform::parse_variables_tf(&content);
+
+    if let Ok(mut cache) = VARIABLES_CACHE.lock() {
+        cache.insert(path.to_path_buf(), (key, vars.clone()));
+    }
+
+    Ok(vars)
+}
+
 /// Copy bundled templates into app-data on first run (or version change).
 pub fn setup_templates(app: &AppHandle) -> Result<(), String> {
     let app_data_dir = app.path().app_data_dir().map_err(|e| e.to_string())?;
@@ -109,6 +146,10 @@ pub fn clear_templates_cache(app: AppHandle) -> Result<String, String> {
             .map_err(|e| format!("Failed to remove version file: {}", e))?;
     }
 
+    if let Ok(mut cache) = VARIABLES_CACHE.lock() {
+        cache.clear();
+    }
+
     setup_templates(&app)?;
 
     Ok("Templates cache cleared and refreshed".to_string())
@@ -263,12 +304,16 @@ pub fn get_template_variables(
     let templates_dir = get_templates_dir(&app)?;
     let variables_path = templates_dir.join(&safe_template_id).join("variables.tf");
 
-    if !variables_path.exists() {
-        return Err(format!("Template not found: {}", safe_template_id));
-    }
-
-    let content = fs::read_to_string(&variables_path).map_err(|e| e.to_string())?;
-    let variables = terraform::parse_variables_tf(&content);
+    // The metadata lookup inside the cached parse doubles as the existence
+    // check, so the hot path costs a single stat; only the error path
+    // re-checks to report a missing template distinctly.
+    let variables = match parse_variables_file_cached(&variables_path) {
+        Ok(vars) => vars,
+        Err(_) if !variables_path.exists() => {
+            return Err(format!("Template not found: {}", safe_template_id));
+        }
+        Err(e) => return Err(e),
+    };
 
     // Filter out internal variables that are automatically set by the app
     let filtered_variables: Vec<terraform::TerraformVariable> = variables
@@ -523,4 +568,40 @@ mod tests {
         assert!(tfvars.contains("create_new_vnet = false"));
         assert!(tfvars.contains("create_unity_catalog = true"));
     }
+
+    // ── parse_variables_file_cached ─────────────────────────────────────
+
+    #[test]
+    fn cached_parse_returns_parsed_variables() {
+        let tmp = tempfile::tempdir().unwrap();
+        let path = tmp.path().join("variables.tf");
+        fs::write(&path, "variable \"prefix\" {\n  type = string\n}\n").unwrap();
+
+        let first = parse_variables_file_cached(&path).unwrap();
+        let second = parse_variables_file_cached(&path).unwrap();
+
+        assert_eq!(first.len(), 1);
+        assert_eq!(first[0].name, "prefix");
+        assert_eq!(second[0].name, "prefix");
+    }
+
+    #[test]
+    fn cached_parse_picks_up_file_changes() {
+        let tmp = tempfile::tempdir().unwrap();
+        let path = tmp.path().join("variables.tf");
+        fs::write(&path, "variable \"prefix\" {\n  type = string\n}\n").unwrap();
+        let _ = parse_variables_file_cached(&path).unwrap();
+
+        // Different length guarantees a cache-key change even when the
+        // rewrite lands within the same mtime granularity.
+        fs::write(
+            &path,
+            "variable \"prefix\" {\n  type = string\n}\nvariable \"region\" {\n  type = string\n}\n",
+        )
+        .unwrap();
+
+        let vars = parse_variables_file_cached(&path).unwrap();
+        assert_eq!(vars.len(), 2);
+        assert_eq!(vars[1].name, "region");
+    }
 }
@@ -35,6 +35,7 @@ pub fn run() {
             commands::save_configuration,
             commands::run_terraform_command,
             commands::get_deployment_status,
+            commands::get_deployment_status_delta,
             commands::reset_deployment_status,
             commands::cancel_deployment,
             commands::rollback_deployment,
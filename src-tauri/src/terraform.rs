@@ -38,6 +38,38 @@ impl Default for DeploymentStatus {
     }
 }
 
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct DeploymentStatusDelta {
+    pub running: bool,
+    pub command: Option<String>,
+    pub success: Option<bool>,
+    pub can_rollback: bool,
+    pub cursor: usize,
+    pub chunk: String,
+}
+
+/// Build an incremental view of `status` containing only the output appended
+/// since `cursor`, plus the current control state. Pollers feed the returned
+/// cursor back on the next call so each poll transfers just the new bytes.
+///
+/// A cursor that no longer matches the buffer (e.g. after a status reset for
+/// a new command) falls back to resending the output from the start.
+pub fn status_delta(status: &DeploymentStatus, cursor: usize) -> DeploymentStatusDelta {
+    let start = if cursor <= status.output.len() && status.output.is_char_boundary(cursor) {
+        cursor
+    } else {
+        0
+    };
+    DeploymentStatusDelta {
+        running: status.running,
+        command: status.command.clone(),
+        success: status.success,
+        can_rollback: status.can_rollback,
+        cursor: status.output.len(),
+        chunk: status.output[start..].to_string(),
+    }
+}
+
 lazy_static::lazy_static! {
     pub static ref DEPLOYMENT_STATUS: Arc<Mutex<DeploymentStatus>> = Arc::new(Mutex::new(DeploymentStatus::default()));
     pub static ref CURRENT_PROCESS: Arc<Mutex<Option<u32>>> = Arc::new(Mutex::new(None));
@@ -197,33 +229,29 @@ fn extract_string_value(line: &str) -> Option<String> {
 }
 
 fn extract_type_value(line: &str) -> Option<String> {
-    let line = line.trim();
-    if let Some(idx) = line.find('=') {
-        let type_part = line[idx + 1..].trim();
-        return Some(type_part.to_string());
-    }
-    None
+    let (_, type_part) = line.split_once('=')?;
+    Some(type_part.trim().to_string())
 }
 
 fn extract_default_value(line: &str) -> Option<String> {
-    let line = line.trim();
-    if let Some(idx) = line.find('=') {
-        let value_part = line[idx + 1..].trim();
-        // Handle quoted strings
-        if value_part.starts_with('"') && value_part.ends_with('"') {
-            return Some(value_part[1..value_part.len() - 1].to_string());
-        }
-        // Handle other values
-        if !value_part.is_empty() && value_part != "{" && value_part != "[" {
-            return Some(value_part.to_string());
-        }
+    let (_, value_part) = line.split_once('=')?;
+    let value_part = value_part.trim();
+    // Handle quoted strings
+    if value_part.starts_with('"') && value_part.ends_with('"') {
+        return Some(value_part[1..value_part.len() - 1].to_string());
+    }
+    // Handle other values
+    if !value_part.is_empty() && value_part != "{" && value_part != "[" {
+        return Some(value_part.to_string());
     }
     None
 }
 
 pub fn generate_tfvars(values: &HashMap<String, serde_json::Value>, variables: &[TerraformVariable]) -> String {
-    let mut lines = Vec::new();
-    
+    // Accumulate straight into one output buffer instead of collecting a
+    // Vec of lines and joining it at the end.
+    let mut out = String::new();
+
     for var in variables {
         if let Some(value) = values.get(&var.name) {
             // Skip empty strings for required variables (no default)
@@ -293,11 +321,14 @@ pub fn generate_tfvars(values: &HashMap<String, serde_json::Value>, variables: &
                 serde_json::Value::Object(obj) => format_map(&var.name, obj),
                 _ => continue,
             };
-            lines.push(formatted);
+            if !out.is_empty() {
+                out.push('\n');
+            }
+            out.push_str(&formatted);
         }
     }
     
-    lines.join("\n")
+    out
 }
 
 fn format_list(name: &str, arr: &[serde_json::Value]) -> String {
@@ -422,11 +453,28 @@ pub fn run_terraform(
     cmd.spawn().map_err(|e| e.to_string())
 }
 
+lazy_static::lazy_static! {
+    // Resolved terraform binary path, cached after the first successful
+    // lookup so repeated commands don't re-stat every candidate location.
+    // Misses are not cached: the binary can appear mid-session once
+    // install_terraform finishes.
+    static ref TERRAFORM_PATH: Mutex<Option<String>> = Mutex::new(None);
+}
+
 fn get_terraform_path() -> String {
+    let mut cached = TERRAFORM_PATH.lock().unwrap();
+    if let Some(path) = cached.as_ref() {
+        return path.clone();
+    }
     // Reuse the path finding logic from dependencies module
-    crate::dependencies::find_terraform_path()
-        .map(|p| p.to_string_lossy().to_string())
-        .unwrap_or_else(|| "terraform".to_string())
+    match crate::dependencies::find_terraform_path() {
+        Some(p) => {
+            let path = p.to_string_lossy().to_string();
+            *cached = Some(path.clone());
+            path
+        }
+        None => "terraform".to_string(),
+    }
 }
 
 // ─── Import-on-retry: detect "already exists" errors and auto-import ────────
@@ -822,6 +870,16 @@ fn apply_standard_env(cmd: &mut std::process::Command, env_vars: &HashMap<String
         cmd.env(key, value);
     }
     cmd.env("PATH", build_extended_path());
+    // Share one provider cache across deployments: every deployment dir is a
+    // fresh template copy, so without this terraform init re-downloads the
+    // same providers for each workspace.
+    if let Some(home) = dirs::home_dir() {
+        let cache_dir = home.join(".databricks-deployer").join("plugin-cache");
+        if std::fs::create_dir_all(&cache_dir).is_ok() {
+            cmd.env("TF_PLUGIN_CACHE_DIR", &cache_dir);
+        }
+    }
+    cmd.env("TF_IN_AUTOMATION", "1");
     for (key, value) in crate::proxy::get_proxy_env_vars() {
         if !env_vars.contains_key(&*key) {
             cmd.env(&key, &value);
@@ -1147,11 +1205,67 @@ pub fn run_import_batch(
     all_ok
 }
 
+/// Decode a chunk of streamed bytes as UTF-8, carrying any incomplete
+/// trailing sequence over in `pending` so multi-byte characters split across
+/// read boundaries are not mangled.
+pub fn decode_stream_chunk(pending: &mut Vec<u8>, chunk: &[u8]) -> String {
+    pending.extend_from_slice(chunk);
+    match std::str::from_utf8(pending) {
+        Ok(s) => {
+            let out = s.to_string();
+            pending.clear();
+            out
+        }
+        Err(e) => {
+            let valid = e.valid_up_to();
+            // Anything past `valid` is either an incomplete sequence (keep it
+            // for the next chunk) or invalid bytes mid-stream (only possible
+            // if the error has a known length — replace them).
+            if e.error_len().is_none() && pending.len() - valid < 4 {
+                let out = String::from_utf8_lossy(&pending[..valid]).into_owned();
+                pending.drain(..valid);
+                out
+            } else {
+                let out = String::from_utf8_lossy(pending).into_owned();
+                pending.clear();
+                out
+            }
+        }
+    }
+}
+
+/// Drain a child pipe into the shared status output, locking the status mutex
+/// once per read chunk rather than once per line.
+fn drain_pipe(mut reader: impl std::io::Read, status: Arc<Mutex<DeploymentStatus>>) {
+    let mut buf = [0u8; 8192];
+    let mut pending: Vec<u8> = Vec::new();
+    loop {
+        match reader.read(&mut buf) {
+            Ok(0) | Err(_) => break,
+            Ok(n) => {
+                let text = decode_stream_chunk(&mut pending, &buf[..n]);
+                if text.is_empty() {
+                    continue;
+                }
+                if let Ok(mut s) = status.lock() {
+                    s.output.push_str(&text);
+                }
+            }
+        }
+    }
+    if !pending.is_empty() {
+        if let Ok(mut s) = status.lock() {
+            s.output.push_str(&String::from_utf8_lossy(&pending));
+        }
+    }
+}
+
 /// Stream stdout + stderr from a Terraform child process into a shared output
 /// buffer, wait for the child to exit, and return whether it succeeded.
 ///
 /// `set_pid` is called with the child PID so the caller can track it for
-/// cancellation. `append_output` is called for each line of output.
+/// cancellation. Output is appended in read-sized chunks so the status lock
+/// is taken once per chunk and pollers always observe a consistent snapshot.
 pub fn stream_and_wait(
     child: &mut Child,
     append_output: Arc<Mutex<DeploymentStatus>>,
@@ -1162,35 +1276,19 @@ pub fn stream_and_wait(
     let stdout = child.stdout.take();
     let stderr = child.stderr.take();
 
+    // Drain stdout on a helper thread and stderr right here: the calling
+    // thread would otherwise just block in wait(), so one spawn per command
+    // is enough to keep both pipes from filling up.
     let out_status = append_output.clone();
-    let err_status = append_output.clone();
-
-    let h1 = stdout.map(|out| {
-        std::thread::spawn(move || {
-            let reader = std::io::BufReader::new(out);
-            for line in std::io::BufRead::lines(reader).flatten() {
-                if let Ok(mut s) = out_status.lock() {
-                    s.output.push_str(&line);
-                    s.output.push('\n');
-                }
-            }
-        })
+    let h = stdout.map(|out| {
+        std::thread::spawn(move || drain_pipe(out, out_status))
     });
 
-    let h2 = stderr.map(|err| {
-        std::thread::spawn(move || {
-            let reader = std::io::BufReader::new(err);
-            for line in std::io::BufRead::lines(reader).flatten() {
-                if let Ok(mut s) = err_status.lock() {
-                    s.output.push_str(&line);
-                    s.output.push('\n');
-                }
-            }
-        })
-    });
+    if let Some(err) = stderr {
+        drain_pipe(err, append_output);
+    }
 
-    if let Some(h) = h1 { let _ = h.join(); }
-    if let Some(h) = h2 { let _ = h.join(); }
+    if let Some(h) = h { let _ = h.join(); }
 
     child.wait()
         .map(|exit| exit.success())
@@ -2370,5 +2468,84 @@ Error: an association between "/subscriptions/x/subnets/snet-container" and "/su
         let dir = tempfile::tempdir().unwrap();
         cleanup_import_file(dir.path());
     }
+
+    // ── status_delta ──────────────────────────────────────────────────
+
+    fn status_with_output(output: &str) -> DeploymentStatus {
+        DeploymentStatus {
+            running: true,
+            command: Some("terraform apply".to_string()),
+            output: output.to_string(),
+            success: None,
+            can_rollback: false,
+        }
+    }
+
+    #[test]
+    fn status_delta_from_zero_returns_full_output() {
+        let status = status_with_output("line one\nline two\n");
+        let delta = status_delta(&status, 0);
+        assert_eq!(delta.chunk, "line one\nline two\n");
+        assert_eq!(delta.cursor, status.output.len());
+        assert!(delta.running);
+    }
+
+    #[test]
+    fn status_delta_returns_only_new_bytes() {
+        let status = status_with_output("line one\nline two\n");
+        let cursor = "line one\n".len();
+        let delta = status_delta(&status, cursor);
+        assert_eq!(delta.chunk, "line two\n");
+        assert_eq!(delta.cursor, status.output.len());
+    }
+
+    #[test]
+    fn status_delta_empty_when_caught_up() {
+        let status = status_with_output("line one\n");
+        let delta = status_delta(&status, status.output.len());
+        assert!(delta.chunk.is_empty());
+        assert_eq!(delta.cursor, status.output.len());
+    }
+
+    #[test]
+    fn status_delta_stale_cursor_resends_from_start() {
+        // Cursor from a previous, longer run: the buffer was reset for a new
+        // command, so the full output is resent.
+        let status = status_with_output("fresh\n");
+        let delta = status_delta(&status, 10_000);
+        assert_eq!(delta.chunk, "fresh\n");
+        assert_eq!(delta.cursor, status.output.len());
+    }
+
+    // ── decode_stream_chunk ───────────────────────────────────────────
+
+    #[test]
+    fn decode_chunk_plain_ascii() {
+        let mut pending = Vec::new();
+        let out = decode_stream_chunk(&mut pending, b"Creating resource...\n");
+        assert_eq!(out, "Creating resource...\n");
+        assert!(pending.is_empty());
+    }
+
+    #[test]
+    fn decode_chunk_multibyte_split_across_reads() {
+        // "─" (U+2500) is e2 94 80 in UTF-8; split it across two chunks
+        let mut pending = Vec::new();
+        let out1 = decode_stream_chunk(&mut pending, &[b'a', 0xe2, 0x94]);
+        assert_eq!(out1, "a");
+        assert_eq!(pending, vec![0xe2, 0x94]);
+
+        let out2 = decode_stream_chunk(&mut pending, &[0x80, b'b']);
+        assert_eq!(out2, "\u{2500}b");
+        assert!(pending.is_empty());
+    }
+
+    #[test]
+    fn decode_chunk_invalid_bytes_replaced() {
+        let mut pending = Vec::new();
+        let out = decode_stream_chunk(&mut pending, &[b'x', 0xff, b'y']);
+        assert_eq!(out, "x\u{fffd}y");
+        assert!(pending.is_empty());
+    }
 }
 
@@ -57,6 +57,18 @@ const COLLAPSIBLE_SECTIONS = new Set([
   "Tags",
 ]);
 
+// Region option elements are static per cloud; build them once at module
+// load so the form's keystroke re-renders don't rebuild the lists.
+const AWS_REGION_OPTIONS = AWS_REGIONS.map((r) => (
+  <option key={r.value} value={r.value}>{r.label}</option>
+));
+const AZURE_REGION_OPTIONS = AZURE_REGIONS.map((r) => (
+  <option key={r.value} value={r.value}>{r.label}</option>
+));
+const GCP_REGION_OPTIONS = GCP_REGIONS.map((r) => (
+  <option key={r.value} value={r.value}>{r.label}</option>
+));
+
 export function ConfigurationScreen() {
   const {
     selectedTemplate, selectedCloud,
@@ -1059,9 +1071,7 @@ export function ConfigurationScreen() {
             className={formSubmitAttempted && !formValues[variable.name] ? "input-error" : ""}
           >
             <option value="" disabled>Please select region</option>
-            {AWS_REGIONS.map((r) => (
-              <option key={r.value} value={r.value}>{r.label}</option>
-            ))}
+            {AWS_REGION_OPTIONS}
           </select>
         ) : variable.name === "location" ? (
           <select
@@ -1070,9 +1080,7 @@ export function ConfigurationScreen() {
             className={formSubmitAttempted && !formValues[variable.name] ? "input-error" : ""}
           >
             <option value="" disabled>Please select region</option>
-            {AZURE_REGIONS.map((r) => (
-              <option key={r.value} value={r.value}>{r.label}</option>
-            ))}
+            {AZURE_REGION_OPTIONS}
           </select>
         ) : variable.name === "google_region" ? (
           <select
@@ -1081,9 +1089,7 @@ export function ConfigurationScreen() {
             className={formSubmitAttempted && !formValues[variable.name] ? "input-error" : ""}
           >
             <option value="" disabled>Please select region</option>
-            {GCP_REGIONS.map((r) => (
-              <option key={r.value} value={r.value}>{r.label}</option>
-            ))}
+            {GCP_REGION_OPTIONS}
           </select>
         ) : variable.name === "network_configuration" ? (
           <select
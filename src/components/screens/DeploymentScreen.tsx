@@ -1,4 +1,5 @@
-import { useMemo, useState, useEffect, useRef } from "react";
+import { memo, useMemo, useState, useEffect, useRef } from "react";
+import { UI } from "../../constants";
 import { useWizard } from "../../hooks/useWizard";
 import type { DeploymentStep } from "../../hooks/useDeployment";
 import { GitIntegrationCard } from "../GitIntegrationCard";
@@ -60,15 +61,53 @@ function CopyButton({ text, onCopy }: { text: string; onCopy: (t: string) => voi
   );
 }
 
+// ── Terraform log patterns ─────────────────────────────────────────────
+// Compiled once at module load — these run against every log line each time
+// the output is re-parsed.
+const RE_ADD = /^\s*\+/;
+const RE_CREATED = /Creation complete/;
+const RE_REMOVE = /^\s*-/;
+const RE_DESTROY = /Destroying|Destruction complete/;
+const RE_CHANGE = /^\s*~/;
+const RE_MODIFY = /Modifying/;
+const RE_ERROR_MARK = /Error:|╷|│|╵/;
+const RE_ERROR_WORD = /error\b/i;
+const RE_WILL_CREATE = /^#\s+(\S+)\s+will be created/;
+const RE_WILL_DESTROY = /^#\s+(\S+)\s+will be destroyed/;
+const RE_WILL_UPDATE = /^#\s+(\S+)\s+will be updated/;
+const RE_IMPORTED = /^\[IMPORTED\]\s+(\S+)/;
+const RE_CREATING = /^([^:]+):\s*Creating\.\.\./;
+const RE_CREATE_DONE = /^([^:]+):\s*Creation complete after\s*(\S+)/;
+const RE_CREATE_DONE_BARE = /^([^:]+):\s*Creation complete/;
+const RE_DESTROYING = /^([^:]+):\s*Destroying\.\.\./;
+const RE_DESTROY_DONE = /^([^:]+):\s*Destruction complete after\s*(\S+)/;
+const RE_DESTROY_DONE_BARE = /^([^:]+):\s*Destruction complete/;
+const RE_PLAN_SUMMARY = /Plan:\s*(\d+)\s*to add,\s*(\d+)\s*to change,\s*(\d+)\s*to destroy/g;
+const RE_OUTPUT_LINE = /^(\w+)\s*=\s*"([^"]*)"$/;
+const RE_CATALOG_EXISTS = /Catalog ['"]([^'"]+)['"] already exists/;
+
 function formatTerraformOutput(output: string): React.ReactNode[] {
-  return output.split("\n").map((line, i) => {
+  // Only render the tail of long logs: the DOM cost of a full apply log
+  // (thousands of lines) dwarfs its usefulness, and the Copy button still
+  // grabs the complete output.
+  const lines = output.split("\n");
+  const start = Math.max(0, lines.length - UI.LOG_TAIL_LINES);
+  const nodes = lines.slice(start).map((line, i) => {
     let cls = "tf-info";
-    if (/^\s*\+/.test(line) || /Creation complete/.test(line)) cls = "tf-add";
-    else if (/^\s*-/.test(line) || /Destroying|Destruction complete/.test(line)) cls = "tf-destroy";
-    else if (/^\s*~/.test(line) || /Modifying/.test(line)) cls = "tf-change";
-    else if (/Error:|╷|│|╵/.test(line) || /error\b/i.test(line)) cls = "tf-error";
-    return <div key={i} className={cls}>{line}</div>;
+    if (RE_ADD.test(line) || RE_CREATED.test(line)) cls = "tf-add";
+    else if (RE_REMOVE.test(line) || RE_DESTROY.test(line)) cls = "tf-destroy";
+    else if (RE_CHANGE.test(line) || RE_MODIFY.test(line)) cls = "tf-change";
+    else if (RE_ERROR_MARK.test(line) || RE_ERROR_WORD.test(line)) cls = "tf-error";
+    return <div key={start + i} className={cls}>{line}</div>;
   });
+  if (start > 0) {
+    nodes.unshift(
+      <div key="truncated" className="tf-info log-truncated-note">
+        … {start} earlier lines hidden — use the copy button for the full log
+      </div>
+    );
+  }
+  return nodes;
 }
 
 function useElapsedTimer(active: boolean) {
@@ -115,22 +154,22 @@ function useResourceTimeline(output: string | undefined): TimelineData | null {
     const destroyed = new Map<string, string>();
 
     for (const line of lines) {
-      const willCreate = line.match(/^#\s+(\S+)\s+will be created/);
+      const willCreate = line.match(RE_WILL_CREATE);
       if (willCreate) { planned.add(willCreate[1]); continue; }
 
-      const willDestroy = line.match(/^#\s+(\S+)\s+will be destroyed/);
+      const willDestroy = line.match(RE_WILL_DESTROY);
       if (willDestroy) { plannedDestroy.add(willDestroy[1]); continue; }
 
-      const willUpdate = line.match(/^#\s+(\S+)\s+will be updated/);
+      const willUpdate = line.match(RE_WILL_UPDATE);
       if (willUpdate) { planned.add(willUpdate[1]); continue; }
 
-      const importedMatch = line.match(/^\[IMPORTED\]\s+(\S+)/);
+      const importedMatch = line.match(RE_IMPORTED);
       if (importedMatch) {
         imported.set(importedMatch[1], true);
         continue;
       }
 
-      const creatingMatch = line.match(/^([^:]+):\s*Creating\.\.\./);
+      const creatingMatch = line.match(RE_CREATING);
       if (creatingMatch) {
         const name = creatingMatch[1].trim();
         creating.add(name);
@@ -138,7 +177,7 @@ function useResourceTimeline(output: string | undefined): TimelineData | null {
         continue;
       }
 
-      const createdMatch = line.match(/^([^:]+):\s*Creation complete after\s*(\S+)/);
+      const createdMatch = line.match(RE_CREATE_DONE);
       if (createdMatch) {
         const name = createdMatch[1].trim();
         created.set(name, createdMatch[2]);
@@ -147,7 +186,7 @@ function useResourceTimeline(output: string | undefined): TimelineData | null {
         continue;
       }
 
-      const createdNoDuration = line.match(/^([^:]+):\s*Creation complete/);
+      const createdNoDuration = line.match(RE_CREATE_DONE_BARE);
       if (createdNoDuration && !createdMatch) {
         const name = createdNoDuration[1].trim();
         created.set(name, "");
@@ -156,7 +195,7 @@ function useResourceTimeline(output: string | undefined): TimelineData | null {
         continue;
       }
 
-      const destroyingMatch = line.match(/^([^:]+):\s*Destroying\.\.\./);
+      const destroyingMatch = line.match(RE_DESTROYING);
       if (destroyingMatch) {
         const name = destroyingMatch[1].trim();
         destroying.add(name);
@@ -164,7 +203,7 @@ function useResourceTimeline(output: string | undefined): TimelineData | null {
         continue;
       }
 
-      const destroyedMatch = line.match(/^([^:]+):\s*Destruction complete after\s*(\S+)/);
+      const destroyedMatch = line.match(RE_DESTROY_DONE);
       if (destroyedMatch) {
         const name = destroyedMatch[1].trim();
         destroyed.set(name, destroyedMatch[2]);
@@ -173,7 +212,7 @@ function useResourceTimeline(output: string | undefined): TimelineData | null {
         continue;
       }
 
-      const destroyedNoDuration = line.match(/^([^:]+):\s*Destruction complete/);
+      const destroyedNoDuration = line.match(RE_DESTROY_DONE_BARE);
       if (destroyedNoDuration && !destroyedMatch) {
         const name = destroyedNoDuration[1].trim();
         destroyed.set(name, "");
@@ -184,7 +223,7 @@ function useResourceTimeline(output: string | undefined): TimelineData | null {
     }
 
     // Use the last Plan: line so the denominator reflects the latest retry
-    const planMatches = [...output.matchAll(/Plan:\s*(\d+)\s*to add,\s*(\d+)\s*to change,\s*(\d+)\s*to destroy/g)];
+    const planMatches = [...output.matchAll(RE_PLAN_SUMMARY)];
     const planMatch = planMatches.length > 0 ? planMatches[planMatches.length - 1] : null;
     const plannedTotal = planMatch ? parseInt(planMatch[1], 10) + parseInt(planMatch[2], 10) : planned.size;
     const plannedDestroyTotal = planMatch ? parseInt(planMatch[3], 10) : plannedDestroy.size;
@@ -273,7 +312,11 @@ const ResourceRowIcon = ({ status }: { status: ResourceEntry["status"] }) => {
   );
 };
 
-function ResourceTimeline({ resources, total, completed, isRollingBack }: {
+// Memoized: DeploymentScreen re-renders every second for the elapsed timer,
+// but the timeline's props only change when new terraform output arrives
+// (useResourceTimeline memoizes on the output string), so this skips
+// re-rendering the whole resource list on timer ticks.
+const ResourceTimeline = memo(function ResourceTimeline({ resources, total, completed, isRollingBack }: {
   resources: ResourceEntry[];
   total: number;
   completed: number;
@@ -338,7 +381,7 @@ function ResourceTimeline({ resources, total, completed, isRollingBack }: {
       </div>
     </div>
   );
-}
+});
 
 export function DeploymentScreen() {
   const ctx = useWizard();
@@ -381,12 +424,19 @@ export function DeploymentScreen() {
   
   const getCatalogExistsError = (output: string | undefined): string | null => {
     if (!output) return null;
-    const match = output.match(/Catalog ['"]([^'"]+)['"] already exists/);
+    const match = output.match(RE_CATALOG_EXISTS);
     return match ? match[1] : null;
   };
 
   const timeline = useResourceTimeline(status?.output);
 
+  // Cache the formatted log fragment so unrelated re-renders (e.g. the
+  // once-per-second elapsed timer) don't re-parse the whole output.
+  const formattedLog = useMemo(
+    () => (status?.output ? formatTerraformOutput(status.output) : null),
+    [status?.output]
+  );
+
   const resourceCounts = useMemo(() => {
     if (!timeline) return null;
     return {
@@ -403,70 +453,75 @@ export function DeploymentScreen() {
     if (!status?.output) return {};
     const outputs: Record<string, string> = {};
     for (const line of status.output.split('\n')) {
-      const match = line.match(/^(\w+)\s*=\s*"([^"]*)"$/);
+      const match = line.match(RE_OUTPUT_LINE);
       if (match) outputs[match[1]] = match[2];
     }
     return outputs;
   }, [status?.output]);
   
-  const stepInfo: Record<DeploymentStep, { title: string; description: string }> = {
-    ready: { title: "Ready to Deploy", description: "Click below to start the deployment process." },
-    initializing: { title: "Preparing Environment", description: "Setting up Terraform and downloading required providers..." },
-    planning: { title: "Analyzing Changes", description: "Determining what resources will be created..." },
-    review: { title: "Review & Confirm", description: "Enable 'Show detailed logs' below to review the planned changes, then confirm to proceed." },
-    deploying: isRollingBack 
-      ? { title: "Cleaning Up Resources", description: "Removing deployed resources. This may take several minutes..." }
-      : { title: "Creating Workspace", description: isSraTemplate
-          ? "Deploying your SRA workspace. Typical time: 20-40 minutes."
-          : "Deploying your Databricks workspace. Typical time: 10-15 minutes." },
-    complete: isRollingBack
-      ? { title: "Cleanup Complete!", description: "All resources have been successfully removed." }
-      : { title: "Deployment Complete!", description: "Your Databricks workspace has been successfully created." },
-    failed: { title: "Deployment Failed", description: "An error occurred. Review the logs below for details." },
-  };
-
-  const currentStepInfo = stepInfo[deploymentStep];
+  // Memoized: the elapsed-timer re-render fires every second while deploying,
+  // and the header copy only changes with the step/rollback/template flags.
+  const currentStepInfo = useMemo(() => {
+    const stepInfo: Record<DeploymentStep, { title: string; description: string }> = {
+      ready: { title: "Ready to Deploy", description: "Click below to start the deployment process." },
+      initializing: { title: "Preparing Environment", description: "Setting up Terraform and downloading required providers..." },
+      planning: { title: "Analyzing Changes", description: "Determining what resources will be created..." },
+      review: { title: "Review & Confirm", description: "Enable 'Show detailed logs' below to review the planned changes, then confirm to proceed." },
+      deploying: isRollingBack
+        ? { title: "Cleaning Up Resources", description: "Removing deployed resources. This may take several minutes..." }
+        : { title: "Creating Workspace", description: isSraTemplate
+            ? "Deploying your SRA workspace. Typical time: 20-40 minutes."
+            : "Deploying your Databricks workspace. Typical time: 10-15 minutes." },
+      complete: isRollingBack
+        ? { title: "Cleanup Complete!", description: "All resources have been successfully removed." }
+        : { title: "Deployment Complete!", description: "Your Databricks workspace has been successfully created." },
+      failed: { title: "Deployment Failed", description: "An error occurred. Review the logs below for details." },
+    };
+    return stepInfo[deploymentStep];
+  }, [deploymentStep, isRollingBack, isSraTemplate]);
 
   return (
     <div className="container">
-      {confirmAction === "cancel" && (
-        <ConfirmDialog
-          title={isRollingBack ? "Cancel Cleanup?" : "Cancel Deployment?"}
-          message={isRollingBack
-            ? "Cancelling mid-cleanup can leave resources in an inconsistent state, with some removed and others still remaining. It is recommended to wait for the cleanup to complete."
-            : "Cancelling mid-deployment can leave resources in an inconsistent state. It is recommended to wait for the deployment to complete and then clean up if needed."}
-          confirmLabel="Yes, Cancel"
-          onConfirm={() => { setConfirmAction(null); onCancel(); }}
-          onCancel={() => setConfirmAction(null)}
-        />
-      )}
-      {confirmAction === "rollback" && (
-        <ConfirmDialog
-          title="Delete Workspace & Resources?"
-          message="This will destroy all resources created by this deployment. This action cannot be undone."
-          confirmLabel="Yes, Delete All"
-          onConfirm={() => { setConfirmAction(null); onRollback(); }}
-          onCancel={() => setConfirmAction(null)}
-        />
-      )}
-      {confirmAction === "newDeployment" && (
-        <ConfirmDialog
-          title="Start New Deployment?"
-          message="This will clear the current configuration and return to the welcome screen. Any partially created resources from the failed deployment will remain."
-          confirmLabel="Yes, Start New"
-          onConfirm={() => { setConfirmAction(null); onResetToWelcome(); }}
-          onCancel={() => setConfirmAction(null)}
-        />
-      )}
-      {confirmAction === "newDeploymentAfterSuccess" && (
-        <ConfirmDialog
-          title="Start New Deployment?"
-          message="This will clear the current configuration and return to the welcome screen. Your deployed resources will not be affected."
-          confirmLabel="Yes, Start New"
-          onConfirm={() => { setConfirmAction(null); onResetToWelcome(true); }}
-          onCancel={() => setConfirmAction(null)}
-        />
-      )}
+      {confirmAction && (() => {
+        const dialogs: Record<NonNullable<typeof confirmAction>, { title: string; message: string; confirmLabel: string; onConfirm: () => void }> = {
+          cancel: {
+            title: isRollingBack ? "Cancel Cleanup?" : "Cancel Deployment?",
+            message: isRollingBack
+              ? "Cancelling mid-cleanup can leave resources in an inconsistent state, with some removed and others still remaining. It is recommended to wait for the cleanup to complete."
+              : "Cancelling mid-deployment can leave resources in an inconsistent state. It is recommended to wait for the deployment to complete and then clean up if needed.",
+            confirmLabel: "Yes, Cancel",
+            onConfirm: onCancel,
+          },
+          rollback: {
+            title: "Delete Workspace & Resources?",
+            message: "This will destroy all resources created by this deployment. This action cannot be undone.",
+            confirmLabel: "Yes, Delete All",
+            onConfirm: onRollback,
+          },
+          newDeployment: {
+            title: "Start New Deployment?",
+            message: "This will clear the current configuration and return to the welcome screen. Any partially created resources from the failed deployment will remain.",
+            confirmLabel: "Yes, Start New",
+            onConfirm: () => onResetToWelcome(),
+          },
+          newDeploymentAfterSuccess: {
+            title: "Start New Deployment?",
+            message: "This will clear the current configuration and return to the welcome screen. Your deployed resources will not be affected.",
+            confirmLabel: "Yes, Start New",
+            onConfirm: () => onResetToWelcome(true),
+          },
+        };
+        const dialog = dialogs[confirmAction];
+        return (
+          <ConfirmDialog
+            title={dialog.title}
+            message={dialog.message}
+            confirmLabel={dialog.confirmLabel}
+            onConfirm={() => { setConfirmAction(null); dialog.onConfirm(); }}
+            onCancel={() => setConfirmAction(null)}
+          />
+        );
+      })()}
 
       {!isWorking && deploymentStep !== "complete" && (
         <button className="back-btn" onClick={onGoBack}>
@@ -539,7 +594,7 @@ export function DeploymentScreen() {
 
       {error && <div className="alert alert-error">{error}</div>}
 
-      <div style={{ marginTop: "24px", display: "flex", alignItems: "center", justifyContent: "center" }}>
+      <div className="actions-row">
         <label className="log-toggle">
           <input
             type="checkbox"
@@ -550,7 +605,7 @@ export function DeploymentScreen() {
         </label>
       </div>
 
-      <div style={{ marginTop: "24px", display: "flex", flexWrap: "wrap", gap: "12px", justifyContent: "center", alignItems: "center" }}>
+      <div className="actions-row">
         {isWorking && (
           <button className="btn btn-danger" onClick={() => setConfirmAction("cancel")}>
             Cancel
@@ -579,28 +634,23 @@ export function DeploymentScreen() {
           </p>
         </div>
       )}
-      <div style={{ marginTop: "12px", display: "flex", gap: "12px", justifyContent: "center", alignItems: "center" }}>
+      <div className="actions-row" style={{ marginTop: "12px" }}>
         {deploymentStep === "complete" && !isRollingBack && (() => {
           const workspaceUrl = parsedOutputs.workspace_url;
           const metastoreStatus = parsedOutputs.metastore_status;
           const metastoreId = parsedOutputs.metastore_id;
           
           return (
-            <div style={{ display: "flex", flexDirection: "column", alignItems: "center", width: "100%", maxWidth: "600px", margin: "0 auto" }}>
+            <div className="completion-container">
               {workspaceUrl && (
-                <div style={{
-                  background: "linear-gradient(135deg, #1a3a1a 0%, #0d2610 100%)",
-                  border: "1px solid #2d5a2d", borderRadius: "12px", padding: "24px",
-                  marginBottom: "20px", width: "100%", textAlign: "center"
-                }}>
-                  <div style={{ color: "var(--text-muted)", fontSize: "12px", marginBottom: "8px", textTransform: "uppercase", letterSpacing: "1px" }}>
+                <div className="workspace-card">
+                  <div className="workspace-card-label">
                     Your Workspace
                   </div>
-                  <div style={{ display: "flex", alignItems: "center", justifyContent: "center", gap: "8px", marginBottom: "16px" }}>
-                    <a 
-                      href={workspaceUrl.startsWith("http") ? workspaceUrl : `https://${workspaceUrl}`} 
+                  <div className="workspace-card-url">
+                    <a
+                      href={workspaceUrl.startsWith("http") ? workspaceUrl : `https://${workspaceUrl}`}
                       target="_blank" rel="noopener noreferrer"
-                      style={{ color: "var(--success)", fontSize: "16px", fontWeight: "500", wordBreak: "break-all" }}
                     >
                       {workspaceUrl}
                     </a>
@@ -618,12 +668,12 @@ export function DeploymentScreen() {
               )}
 
               {(metastoreStatus || metastoreId) && (
-                <div style={{ background: "var(--bg-secondary)", border: "1px solid var(--border)", borderRadius: "8px", padding: "16px 20px", marginBottom: "20px", width: "100%" }}>
-                  <div style={{ display: "flex", alignItems: "center", gap: "12px", flexWrap: "wrap" }}>
-                    <span style={{ fontSize: "20px" }}>📊</span>
+                <div className="info-card">
+                  <div className="info-card-content">
+                    <span className="info-card-icon">📊</span>
                     <div style={{ flex: 1 }}>
-                      <div style={{ color: "var(--text-primary)", fontSize: "14px", fontWeight: "500" }}>Unity Catalog</div>
-                      <div style={{ color: "var(--text-muted)", fontSize: "13px" }}>{metastoreStatus || `Metastore: ${metastoreId}`}</div>
+                      <div className="info-card-title">Unity Catalog</div>
+                      <div className="info-card-subtitle">{metastoreStatus || `Metastore: ${metastoreId}`}</div>
                     </div>
                   </div>
                 </div>
@@ -634,22 +684,21 @@ export function DeploymentScreen() {
                 <GitIntegrationCard deploymentName={deployment.deploymentName} />
               )}
 
-              <div style={{ display: "flex", gap: "12px", width: "100%", marginBottom: "20px" }}>
-                <button className="btn btn-secondary" style={{ flex: 1 }} onClick={() => setConfirmAction("newDeploymentAfterSuccess")}>
+              <div className="secondary-actions">
+                <button className="btn btn-secondary" onClick={() => setConfirmAction("newDeploymentAfterSuccess")}>
                   Start New Deployment
                 </button>
                 {templatePath && (
-                  <button className="btn btn-secondary" style={{ flex: 1 }} onClick={onOpenTemplateFolder}>
+                  <button className="btn btn-secondary" onClick={onOpenTemplateFolder}>
                     Open Folder
                   </button>
                 )}
               </div>
 
               {status?.can_rollback && (
-                <button 
-                  className="btn" 
+                <button
+                  className="btn btn-ghost"
                   onClick={() => setConfirmAction("rollback")}
-                  style={{ background: "transparent", border: "1px solid #666", color: "var(--text-muted)", fontSize: "13px", padding: "8px 16px" }}
                 >
                   Delete Workspace & Resources
                 </button>
@@ -699,9 +748,9 @@ export function DeploymentScreen() {
             </div>
             {status?.can_rollback && (
               <button
-                className="btn"
+                className="btn btn-ghost"
                 onClick={() => setConfirmAction("rollback")}
-                style={{ marginTop: "16px", background: "transparent", border: "1px solid #666", color: "var(--text-muted)", fontSize: "13px", padding: "8px 16px" }}
+                style={{ marginTop: "16px" }}
               >
                 Destroy Deployed Resources
               </button>
@@ -714,7 +763,7 @@ export function DeploymentScreen() {
         <div className="log-panel">
           <CopyButton text={status.output} onCopy={copyToClipboard} />
           <div className="output expanded terraform-log">
-            {formatTerraformOutput(status.output)}
+            {formattedLog}
             <div ref={logEndRef} />
           </div>
         </div>
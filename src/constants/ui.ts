@@ -8,6 +8,7 @@ export const POLLING = {
 
 export const UI = {
   REACT_PAINT_DELAY: 50,
+  LOG_TAIL_LINES: 500,
 } as const;
 
 export const DEFAULTS = {
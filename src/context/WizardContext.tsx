@@ -154,6 +154,10 @@ export function WizardProvider({ children }: { children: ReactNode }) {
   const [loadingTemplate, setLoadingTemplate] = useState<string | null>(null);
   const templateRequestRef = useRef<string | null>(null);
   const cloudRequestRef = useRef<string | null>(null);
+  // Parsed variables per template, cached for the session: templates are
+  // bundled with the app and don't change while it runs, so re-selecting a
+  // template skips the IPC round-trip and backend re-parse.
+  const variablesCacheRef = useRef<Record<string, TerraformVariable[]>>({});
   const [showAdvanced, setShowAdvanced] = useState(false);
   const [formSubmitAttempted, setFormSubmitAttempted] = useState(false);
   const [tagPairs, setTagPairs] = useState<{ key: string; value: string }[]>([]);
@@ -326,15 +330,18 @@ export function WizardProvider({ children }: { children: ReactNode }) {
 
     setTimeout(async () => {
       try {
+        const cached = variablesCacheRef.current[template.id];
         const [vars] = await Promise.all([
-          invoke<TerraformVariable[]>("get_template_variables", {
-            templateId: template.id,
-          }),
+          cached ??
+            invoke<TerraformVariable[]>("get_template_variables", {
+              templateId: template.id,
+            }),
           new Promise((resolve) => setTimeout(resolve, POLLING.MIN_LOADING_TIME)),
         ]);
 
         if (templateRequestRef.current !== requestId) return;
 
+        variablesCacheRef.current[template.id] = vars;
         setVariables(vars);
 
         if (!isSameTemplate || !hasExistingValues) {
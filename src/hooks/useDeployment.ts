@@ -1,18 +1,31 @@
 import { useState, useCallback, useRef, useEffect } from "react";
 import { invoke } from "@tauri-apps/api/core";
-import { DeploymentStatus, Template, CloudCredentials, UnityCatalogConfig } from "../types";
+import { DeploymentStatus, DeploymentStatusDelta, Template, CloudCredentials, UnityCatalogConfig } from "../types";
 import { POLLING, OBJECT_FIELD_DECOMPOSITION, LIST_FIELD_DECOMPOSITION } from "../constants";
+import type { ListSubField } from "../constants";
 
 export type DeploymentStep = "ready" | "initializing" | "planning" | "review" | "deploying" | "complete" | "failed";
 
+// The decomposition tables are constants, so the set of keys they consume and
+// the index-sorted list sub-fields can be computed once at module load instead
+// of being rebuilt on every reconstruction pass.
+const DECOMPOSED_KEYS: ReadonlySet<string> = new Set([
+  ...Object.entries(OBJECT_FIELD_DECOMPOSITION).flatMap(([parent, fields]) => [parent, ...fields.map((f) => f.key)]),
+  ...Object.entries(LIST_FIELD_DECOMPOSITION).flatMap(([parent, fields]) => [parent, ...fields.map((f) => f.key)]),
+]);
+
+const SORTED_LIST_DECOMPOSITION: [string, ListSubField[]][] = Object.entries(LIST_FIELD_DECOMPOSITION)
+  .map(([parent, fields]) => [parent, [...fields].sort((a, b) => a.index - b.index)] as [string, ListSubField[]]);
+
 /**
  * Reconstructs complex Terraform objects from decomposed sub-field form values.
  * Sub-fields use keys like `workspace_vnet__cidr`; this rebuilds them into
  * `{ workspace_vnet: { cidr: "..." } }` for proper tfvars generation.
+ * Empty values (undefined, null, "") are dropped, so callers can pass raw
+ * form state without a separate filtering pass.
  */
 export function reconstructObjects(values: Record<string, any>): Record<string, any> {
   const result: Record<string, any> = {};
-  const usedKeys = new Set<string>();
 
   for (const [parentName, subFields] of Object.entries(OBJECT_FIELD_DECOMPOSITION)) {
     const obj: Record<string, any> = {};
@@ -29,38 +42,33 @@ export function reconstructObjects(values: Record<string, any>): Record<string,
         }
         current[field.path[field.path.length - 1]] = value;
       }
-      usedKeys.add(field.key);
     }
 
-    usedKeys.add(parentName);
     if (hasAnyValue) {
       result[parentName] = obj;
     }
   }
 
   // Reconstruct list(string) variables from decomposed sub-fields
-  for (const [parentName, subFields] of Object.entries(LIST_FIELD_DECOMPOSITION)) {
+  for (const [parentName, subFields] of SORTED_LIST_DECOMPOSITION) {
     const items: string[] = [];
     let hasAnyValue = false;
 
-    const sorted = [...subFields].sort((a, b) => a.index - b.index);
-    for (const field of sorted) {
+    for (const field of subFields) {
       const value = values[field.key];
       if (value !== undefined && value !== "" && value !== null) {
         hasAnyValue = true;
         items.push(String(value));
       }
-      usedKeys.add(field.key);
     }
 
-    usedKeys.add(parentName);
     if (hasAnyValue) {
       result[parentName] = items;
     }
   }
 
   for (const [key, value] of Object.entries(values)) {
-    if (!usedKeys.has(key)) {
+    if (!DECOMPOSED_KEYS.has(key) && value !== undefined && value !== null && value !== "") {
       result[key] = value;
     }
   }
@@ -148,6 +156,45 @@ export function useDeployment(): UseDeploymentReturn {
     deploymentStepRef.current = deploymentStep;
   }, [deploymentStep]);
 
+  // Incremental output accumulation for delta polling: the backend returns
+  // only the bytes appended since `cursor`, which we splice onto the output
+  // rebuilt here.
+  const outputCursorRef = useRef(0);
+  const accumulatedOutputRef = useRef("");
+
+  const applyStatusDelta = useCallback((delta: DeploymentStatusDelta): DeploymentStatus => {
+    const chunkStart = delta.cursor - delta.chunk.length;
+    if (chunkStart === 0) {
+      // Full resync (first poll, or the backend reset the buffer for a new command)
+      accumulatedOutputRef.current = delta.chunk;
+    } else {
+      accumulatedOutputRef.current += delta.chunk;
+    }
+    outputCursorRef.current = delta.cursor;
+    return {
+      running: delta.running,
+      command: delta.command,
+      output: accumulatedOutputRef.current,
+      success: delta.success,
+      can_rollback: delta.can_rollback,
+    };
+  }, []);
+
+  // Start a fresh accumulation run: the next delta fetch asks for the
+  // buffer from the beginning.
+  const resetOutputCursor = useCallback(() => {
+    outputCursorRef.current = 0;
+    accumulatedOutputRef.current = "";
+  }, []);
+
+  // Single fetch+fold step shared by every polling loop in this hook.
+  const fetchStatusDelta = useCallback(async (): Promise<DeploymentStatus> => {
+    const delta = await invoke<DeploymentStatusDelta>("get_deployment_status_delta", {
+      cursor: outputCursorRef.current,
+    });
+    return applyStatusDelta(delta);
+  }, [applyStatusDelta]);
+
   const clearPollInterval = useCallback(() => {
     if (pollIntervalRef.current) {
       clearInterval(pollIntervalRef.current);
@@ -158,14 +205,25 @@ export function useDeployment(): UseDeploymentReturn {
   const pollDeploymentStatus = useCallback(
     (onComplete?: (success: boolean) => void) => {
       clearPollInterval();
+      resetOutputCursor();
 
       pollIntervalRef.current = setInterval(async () => {
         try {
-          const status = await invoke<DeploymentStatus>("get_deployment_status");
+          const status = await fetchStatusDelta();
 
           if (!isMountedRef.current) return;
-
-          setDeploymentStatus(status);
+          // Keep the previous object when an idle poll returns no new output
+          // and unchanged flags — React then bails out of re-rendering.
+          setDeploymentStatus((prev) =>
+            prev !== null &&
+            prev.output === status.output &&
+            prev.running === status.running &&
+            prev.command === status.command &&
+            prev.success === status.success &&
+            prev.can_rollback === status.can_rollback
+              ? prev
+              : status
+          );
 
           if (!status.running && status.success !== null) {
             clearPollInterval();
@@ -181,7 +239,7 @@ export function useDeployment(): UseDeploymentReturn {
         }
       }, POLLING.STATUS_INTERVAL);
     },
-    [clearPollInterval]
+    [clearPollInterval, resetOutputCursor, fetchStatusDelta]
   );
 
   const clearWaitInterval = useCallback(() => {
@@ -191,21 +249,24 @@ export function useDeployment(): UseDeploymentReturn {
     }
   }, []);
 
-  // Polls get_deployment_status until status.running is false, then resolves with success/failure.
-  // Used after init and plan to wait for backend completion before proceeding.
+  // Polls deployment status until status.running is false, then resolves with
+  // success/failure. Used after init and plan to wait for backend completion
+  // before proceeding. Uses the same cursor-delta command as
+  // pollDeploymentStatus so only new output crosses the bridge each tick.
   const waitForCommandComplete = useCallback(async (): Promise<boolean> => {
     clearWaitInterval();
+    resetOutputCursor();
     return new Promise((resolve) => {
       const checkStatus = async () => {
         try {
-          const status = await invoke<DeploymentStatus>("get_deployment_status");
-          
+          const status = await fetchStatusDelta();
+
           if (!isMountedRef.current) {
             return { done: true, success: false };
           }
-          
+
           setDeploymentStatus(status);
-          
+
           if (!status.running) {
             return { done: true, success: status.success ?? false };
           }
@@ -225,7 +286,7 @@ export function useDeployment(): UseDeploymentReturn {
       }, POLLING.STATUS_INTERVAL);
       waitIntervalRef.current = interval;
     });
-  }, [clearWaitInterval]);
+  }, [clearWaitInterval, resetOutputCursor, fetchStatusDelta]);
 
   // Refs to store credentials for startApply
   const credentialsRef = useRef<CloudCredentials>({});
@@ -251,14 +312,9 @@ export function useDeployment(): UseDeploymentReturn {
       // Store credentials for later use in startApply
       credentialsRef.current = credentials;
 
-      // Build variables from form values: filter empties, then reconstruct complex objects
-      const rawValues: Record<string, any> = {};
-      for (const [key, value] of Object.entries(formValues)) {
-        if (value !== undefined && value !== null && value !== "") {
-          rawValues[key] = value;
-        }
-      }
-      const values = reconstructObjects(rawValues);
+      // Build variables from form values; reconstructObjects drops empties
+      // and rebuilds decomposed complex objects in a single pass
+      const values = reconstructObjects(formValues);
 
       // Always pass existing metastore ID if detected (regardless of UC catalog enabled)
       if (ucConfig.metastore_id) {
@@ -408,10 +464,12 @@ export function useDeployment(): UseDeploymentReturn {
         credentials: rollbackCredentials,
       });
 
-      // Poll for rollback completion
+      // Poll for rollback completion via the same cursor-delta fetch as the
+      // other loops, so only new output crosses the bridge each tick
+      resetOutputCursor();
       pollIntervalRef.current = setInterval(async () => {
         try {
-          const status = await invoke<DeploymentStatus>("get_deployment_status");
+          const status = await fetchStatusDelta();
 
           if (!isMountedRef.current) return;
 
@@ -441,7 +499,7 @@ export function useDeployment(): UseDeploymentReturn {
       setIsRollingBack(false);
       setDeploymentStep("failed");
     }
-  }, [clearPollInterval]);
+  }, [clearPollInterval, resetOutputCursor, fetchStatusDelta]);
 
   const openTemplateFolder = useCallback(async () => {
     if (templatePath) {
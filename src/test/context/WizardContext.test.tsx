@@ -34,6 +34,8 @@ beforeEach(() => {
         return {};
       case "get_aws_profiles":
         return [];
+      case "get_deployment_status_delta":
+        return { running: false, command: null, success: false, can_rollback: false, cursor: 0, chunk: "" };
       default:
         return undefined;
     }
@@ -744,6 +746,9 @@ describe("WizardContext", () => {
       mockInvoke.mockImplementation(async (cmd: string) => {
         if (cmd === "get_templates") return [template];
         if (cmd === "get_template_variables") return [];
+        if (cmd === "get_deployment_status_delta") {
+          return { running: false, command: "plan", success: true, can_rollback: false, cursor: 0, chunk: "" };
+        }
         return {};
       });
 
@@ -1,7 +1,7 @@
 import { renderHook, act, waitFor } from "@testing-library/react";
 import { invoke } from "@tauri-apps/api/core";
 import { useDeployment, reconstructObjects } from "../../hooks/useDeployment";
-import { DeploymentStatus, Template, CloudCredentials, UnityCatalogConfig } from "../../types";
+import { DeploymentStatus, DeploymentStatusDelta, Template, CloudCredentials, UnityCatalogConfig } from "../../types";
 
 const mockInvoke = vi.mocked(invoke);
 
@@ -38,20 +38,33 @@ const successStatus: DeploymentStatus = {
   can_rollback: true,
 };
 
-const failedStatus: DeploymentStatus = {
+// Delta-poll responses (pollDeploymentStatus uses get_deployment_status_delta):
+// `cursor` is the total output length, `chunk` the bytes since the last poll.
+const runningDelta: DeploymentStatusDelta = {
+  running: true,
+  command: "apply",
+  success: null,
+  can_rollback: false,
+  cursor: "Applying...\n".length,
+  chunk: "Applying...\n",
+};
+
+const successDelta: DeploymentStatusDelta = {
   running: false,
   command: "apply",
-  output: "Error: failed",
-  success: false,
+  success: true,
   can_rollback: true,
+  cursor: "Applying...\nApply complete!".length,
+  chunk: "Apply complete!",
 };
 
-const runningStatus: DeploymentStatus = {
-  running: true,
-  command: "init",
-  output: "Initializing...",
-  success: null,
-  can_rollback: false,
+const failedDelta: DeploymentStatusDelta = {
+  running: false,
+  command: "apply",
+  success: false,
+  can_rollback: true,
+  cursor: "Applying...\nError: failed".length,
+  chunk: "Error: failed",
 };
 
 describe("useDeployment", () => {
@@ -135,8 +148,8 @@ describe("useDeployment", () => {
 
     it("polls until success and sets step to complete", async () => {
       mockInvoke
-        .mockResolvedValueOnce(runningStatus)
-        .mockResolvedValueOnce(successStatus);
+        .mockResolvedValueOnce(runningDelta)
+        .mockResolvedValueOnce(successDelta);
 
       const onComplete = vi.fn();
       const { result } = renderHook(() => useDeployment());
@@ -148,14 +161,80 @@ describe("useDeployment", () => {
 
       await act(async () => { await vi.advanceTimersByTimeAsync(1000); });
       expect(result.current.deploymentStep).toBe("complete");
-      expect(result.current.deploymentStatus).toEqual(successStatus);
+      expect(result.current.deploymentStatus).toEqual({
+        running: false,
+        command: "apply",
+        output: "Applying...\nApply complete!",
+        success: true,
+        can_rollback: true,
+      });
       expect(onComplete).toHaveBeenCalledWith(true);
     });
 
+    it("sends its cursor and accumulates chunks across polls", async () => {
+      mockInvoke
+        .mockResolvedValueOnce(runningDelta)
+        .mockResolvedValueOnce(successDelta);
+
+      const { result } = renderHook(() => useDeployment());
+
+      act(() => { result.current.pollDeploymentStatus(); });
+
+      await act(async () => { await vi.advanceTimersByTimeAsync(1000); });
+      expect(mockInvoke).toHaveBeenCalledWith("get_deployment_status_delta", { cursor: 0 });
+      expect(result.current.deploymentStatus?.output).toBe("Applying...\n");
+
+      await act(async () => { await vi.advanceTimersByTimeAsync(1000); });
+      expect(mockInvoke).toHaveBeenCalledWith("get_deployment_status_delta", { cursor: runningDelta.cursor });
+      expect(result.current.deploymentStatus?.output).toBe("Applying...\nApply complete!");
+    });
+
+    it("keeps the same status object across idle polls with no new output", async () => {
+      const idleDelta: DeploymentStatusDelta = {
+        ...runningDelta,
+        chunk: "",
+        cursor: runningDelta.cursor,
+      };
+      mockInvoke
+        .mockResolvedValueOnce(runningDelta)
+        .mockResolvedValue(idleDelta);
+
+      const { result } = renderHook(() => useDeployment());
+
+      act(() => { result.current.pollDeploymentStatus(); });
+
+      await act(async () => { await vi.advanceTimersByTimeAsync(1000); });
+      const first = result.current.deploymentStatus;
+
+      await act(async () => { await vi.advanceTimersByTimeAsync(2000); });
+      expect(result.current.deploymentStatus).toBe(first);
+    });
+
+    it("replaces accumulated output when the backend resends from the start", async () => {
+      const fullResend: DeploymentStatusDelta = {
+        running: false,
+        command: "apply",
+        success: true,
+        can_rollback: true,
+        cursor: "Fresh output".length,
+        chunk: "Fresh output",
+      };
+      mockInvoke
+        .mockResolvedValueOnce(runningDelta)
+        .mockResolvedValueOnce(fullResend);
+
+      const { result } = renderHook(() => useDeployment());
+
+      act(() => { result.current.pollDeploymentStatus(); });
+
+      await act(async () => { await vi.advanceTimersByTimeAsync(2000); });
+      expect(result.current.deploymentStatus?.output).toBe("Fresh output");
+    });
+
     it("polls until failure and sets step to failed", async () => {
       mockInvoke
-        .mockResolvedValueOnce(runningStatus)
-        .mockResolvedValueOnce(failedStatus);
+        .mockResolvedValueOnce(runningDelta)
+        .mockResolvedValueOnce(failedDelta);
 
       const onComplete = vi.fn();
       const { result } = renderHook(() => useDeployment());
@@ -171,7 +250,7 @@ describe("useDeployment", () => {
     it("continues polling on invoke error", async () => {
       mockInvoke
         .mockRejectedValueOnce(new Error("network"))
-        .mockResolvedValueOnce(successStatus);
+        .mockResolvedValueOnce(successDelta);
 
       const { result } = renderHook(() => useDeployment());
 
@@ -185,7 +264,7 @@ describe("useDeployment", () => {
     });
 
     it("works without onComplete callback", async () => {
-      mockInvoke.mockResolvedValueOnce(successStatus);
+      mockInvoke.mockResolvedValueOnce(successDelta);
 
       const { result } = renderHook(() => useDeployment());
 
@@ -204,7 +283,7 @@ describe("useDeployment", () => {
     afterEach(() => { vi.useRealTimers(); });
 
     it("stops active polling", async () => {
-      mockInvoke.mockResolvedValue(runningStatus);
+      mockInvoke.mockResolvedValue(runningDelta);
 
       const { result } = renderHook(() => useDeployment());
 
@@ -226,15 +305,15 @@ describe("useDeployment", () => {
   // ---------------------------------------------------------------------------
   describe("startPrepare", () => {
     it("runs full init+plan flow and ends at review", async () => {
-      const initDone: DeploymentStatus = { running: false, command: "init", output: "done", success: true, can_rollback: false };
-      const planDone: DeploymentStatus = { running: false, command: "plan", output: "done", success: true, can_rollback: false };
+      const initDone: DeploymentStatusDelta = { running: false, command: "init", success: true, can_rollback: false, cursor: 4, chunk: "done" };
+      const planDone: DeploymentStatusDelta = { running: false, command: "plan", success: true, can_rollback: false, cursor: 4, chunk: "done" };
 
       mockInvoke.mockResolvedValueOnce(undefined); // reset_deployment_status
       mockInvoke.mockResolvedValueOnce("/tmp/deployments/deploy-azure-simple-123"); // save_configuration
       mockInvoke.mockResolvedValueOnce(undefined); // run_terraform_command (init)
-      mockInvoke.mockResolvedValueOnce(initDone); // get_deployment_status (init)
+      mockInvoke.mockResolvedValueOnce(initDone); // get_deployment_status_delta (init)
       mockInvoke.mockResolvedValueOnce(undefined); // run_terraform_command (plan)
-      mockInvoke.mockResolvedValueOnce(planDone); // get_deployment_status (plan)
+      mockInvoke.mockResolvedValueOnce(planDone); // get_deployment_status_delta (plan)
 
       const { result } = renderHook(() => useDeployment());
 
@@ -248,7 +327,7 @@ describe("useDeployment", () => {
     }, 15000);
 
     it("filters empty form values", async () => {
-      const done: DeploymentStatus = { running: false, command: "init", output: "done", success: true, can_rollback: false };
+      const done: DeploymentStatusDelta = { running: false, command: "init", success: true, can_rollback: false, cursor: 4, chunk: "done" };
 
       mockInvoke.mockResolvedValueOnce(undefined);
       mockInvoke.mockResolvedValueOnce("/tmp/path");
@@ -274,7 +353,7 @@ describe("useDeployment", () => {
     }, 15000);
 
     it("adds Unity Catalog config when enabled", async () => {
-      const done: DeploymentStatus = { running: false, command: "init", output: "done", success: true, can_rollback: false };
+      const done: DeploymentStatusDelta = { running: false, command: "init", success: true, can_rollback: false, cursor: 4, chunk: "done" };
 
       mockInvoke.mockResolvedValueOnce(undefined);
       mockInvoke.mockResolvedValueOnce("/tmp/path");
@@ -305,7 +384,7 @@ describe("useDeployment", () => {
     }, 15000);
 
     it("passes metastore_id even when UC is disabled", async () => {
-      const done: DeploymentStatus = { running: false, command: "init", output: "done", success: true, can_rollback: false };
+      const done: DeploymentStatusDelta = { running: false, command: "init", success: true, can_rollback: false, cursor: 4, chunk: "done" };
 
       mockInvoke.mockResolvedValueOnce(undefined);
       mockInvoke.mockResolvedValueOnce("/tmp/path");
@@ -331,7 +410,7 @@ describe("useDeployment", () => {
     }, 15000);
 
     it("sets failed step when init fails", async () => {
-      const initFailed: DeploymentStatus = { running: false, command: "init", output: "Error", success: false, can_rollback: false };
+      const initFailed: DeploymentStatusDelta = { running: false, command: "init", success: false, can_rollback: false, cursor: 5, chunk: "Error" };
 
       mockInvoke.mockResolvedValueOnce(undefined);
       mockInvoke.mockResolvedValueOnce("/tmp/path");
@@ -348,8 +427,8 @@ describe("useDeployment", () => {
     }, 15000);
 
     it("sets failed step when plan fails", async () => {
-      const initDone: DeploymentStatus = { running: false, command: "init", output: "done", success: true, can_rollback: false };
-      const planFailed: DeploymentStatus = { running: false, command: "plan", output: "Error", success: false, can_rollback: false };
+      const initDone: DeploymentStatusDelta = { running: false, command: "init", success: true, can_rollback: false, cursor: 4, chunk: "done" };
+      const planFailed: DeploymentStatusDelta = { running: false, command: "plan", success: false, can_rollback: false, cursor: 5, chunk: "Error" };
 
       mockInvoke.mockResolvedValueOnce(undefined);
       mockInvoke.mockResolvedValueOnce("/tmp/path");
@@ -388,7 +467,7 @@ describe("useDeployment", () => {
     });
 
     it("reuses existing deploymentName for retries", async () => {
-      const done: DeploymentStatus = { running: false, command: "init", output: "done", success: true, can_rollback: false };
+      const done: DeploymentStatusDelta = { running: false, command: "init", success: true, can_rollback: false, cursor: 4, chunk: "done" };
 
       mockInvoke.mockResolvedValueOnce(undefined);
       mockInvoke.mockResolvedValueOnce("/tmp/path");
@@ -469,8 +548,9 @@ describe("useDeployment", () => {
   // ---------------------------------------------------------------------------
   describe("startRollback", () => {
     it("rolls back and sets complete on success", async () => {
-      const rollbackDone: DeploymentStatus = {
-        running: false, command: "destroy", output: "Destroyed", success: true, can_rollback: false,
+      const rollbackDone: DeploymentStatusDelta = {
+        running: false, command: "destroy", success: true, can_rollback: false,
+        cursor: "Destroyed".length, chunk: "Destroyed",
       };
 
       mockInvoke.mockResolvedValueOnce(undefined);
@@ -490,8 +570,9 @@ describe("useDeployment", () => {
     });
 
     it("keeps isRollingBack true when keepRollingBackOnSuccess is set", async () => {
-      const rollbackDone: DeploymentStatus = {
-        running: false, command: "destroy", output: "Destroyed", success: true, can_rollback: false,
+      const rollbackDone: DeploymentStatusDelta = {
+        running: false, command: "destroy", success: true, can_rollback: false,
+        cursor: "Destroyed".length, chunk: "Destroyed",
       };
 
       mockInvoke.mockResolvedValueOnce(undefined);
@@ -510,8 +591,9 @@ describe("useDeployment", () => {
     });
 
     it("sets failed on rollback failure", async () => {
-      const rollbackFailed: DeploymentStatus = {
-        running: false, command: "destroy", output: "Error", success: false, can_rollback: false,
+      const rollbackFailed: DeploymentStatusDelta = {
+        running: false, command: "destroy", success: false, can_rollback: false,
+        cursor: "Error".length, chunk: "Error",
       };
 
       mockInvoke.mockResolvedValueOnce(undefined);
@@ -633,7 +715,7 @@ describe("useDeployment", () => {
     afterEach(() => { vi.useRealTimers(); });
 
     it("stops polling on cleanup", async () => {
-      mockInvoke.mockResolvedValue(runningStatus);
+      mockInvoke.mockResolvedValue(runningDelta);
 
       const { result } = renderHook(() => useDeployment());
 
@@ -726,6 +808,18 @@ describe("reconstructObjects", () => {
     expect(result.region).toBe("eastus");
   });
 
+  it("drops empty plain values", () => {
+    const result = reconstructObjects({
+      region: "eastus",
+      workspace_name: "",
+      prefix: null,
+    });
+
+    expect(result.region).toBe("eastus");
+    expect(result).not.toHaveProperty("workspace_name");
+    expect(result).not.toHaveProperty("prefix");
+  });
+
   it("skips list reconstruction when all sub-fields are empty", () => {
     const result = reconstructObjects({
       private_subnets_cidr_1: "",
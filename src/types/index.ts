@@ -23,6 +23,7 @@ export type {
   Template,
   TerraformVariable,
   DeploymentStatus,
+  DeploymentStatusDelta,
   AppScreen,
 } from "./wizard";
 
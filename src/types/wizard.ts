@@ -33,6 +33,16 @@ export interface DeploymentStatus {
   can_rollback: boolean;
 }
 
+/** Incremental status poll response: only the output appended since `cursor`. */
+export interface DeploymentStatusDelta {
+  running: boolean;
+  command: string | null;
+  success: boolean | null;
+  can_rollback: boolean;
+  cursor: number;
+  chunk: string;
+}
+
 export type AppScreen =
   | 'welcome'
   | 'dependencies'